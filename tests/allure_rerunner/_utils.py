@@ -2,6 +2,7 @@ import asyncio
 from argparse import ArgumentParser, Namespace
 from pathlib import Path
 from time import monotonic_ns
+from typing import List
 from unittest.mock import AsyncMock, Mock
 
 import pytest
@@ -98,3 +99,12 @@ async def fire_failed_event(dispatcher: Dispatcher) -> ScenarioFailedEvent:
     scenario_failed_event = ScenarioFailedEvent(scenario_result)
     await dispatcher.fire(scenario_failed_event)
     return scenario_failed_event
+
+
+async def drain_scheduler(scheduler: Scheduler) -> List[VirtualScenario]:
+    scenarios = []
+    while True:
+        try:
+            scenarios.append(await scheduler.__anext__())
+        except StopAsyncIteration:
+            return scenarios
@@ -1,18 +1,21 @@
 from typing import Type, Union
-from unittest.mock import AsyncMock, Mock, call
+from unittest.mock import AsyncMock, Mock, call, patch
 
 import pytest
 from baby_steps import given, then, when
 from pytest import raises
-from vedro.core import Dispatcher, Report
+from vedro.core import Dispatcher, Report, ScenarioScheduler
 from vedro.events import (
     CleanupEvent,
+    Event,
     ScenarioFailedEvent,
     ScenarioPassedEvent,
     ScenarioRunEvent,
     ScenarioSkippedEvent,
 )
 
+from vedro_allure_reporter.allure_rerunner import AllureRerunnerPlugin
+
 from ._utils import (
     allure_rerunner,
     dispatcher,
@@ -57,6 +60,52 @@ async def test_reruns_delay_without_reruns_validation(dispatcher: Dispatcher):
         assert str(exc_info.value) == "--allure-reruns-delay must be used with --allure-reruns > 0"
 
 
+@pytest.mark.usefixtures(allure_rerunner.__name__)
+async def test_scenario_events_not_subscribed_without_reruns(dispatcher: Dispatcher):
+    with when, patch.object(dispatcher, "listen", wraps=dispatcher.listen) as listen_:
+        await fire_arg_parsed_event(dispatcher, reruns=0)
+
+    with then:
+        assert listen_.mock_calls == []
+
+
+async def test_scenario_end_subscribed_with_reruns(*, dispatcher: Dispatcher,
+                                                   allure_rerunner: AllureRerunnerPlugin):
+    with when, patch.object(dispatcher, "listen", wraps=dispatcher.listen) as listen_:
+        await fire_arg_parsed_event(dispatcher, reruns=1)
+
+    with then:
+        assert listen_.mock_calls == [
+            call(ScenarioPassedEvent, allure_rerunner.on_scenario_end),
+            call(ScenarioFailedEvent, allure_rerunner.on_scenario_end),
+        ]
+
+
+@pytest.mark.usefixtures(allure_rerunner.__name__)
+async def test_startup_scheduler_validation(dispatcher: Dispatcher):
+    with given:
+        await fire_arg_parsed_event(dispatcher, reruns=1)
+
+    with when, raises(BaseException) as exc_info:
+        await fire_startup_event(dispatcher, Mock())
+
+    with then:
+        assert exc_info.type is AssertionError
+
+
+async def test_startup_without_reruns(*, dispatcher: Dispatcher,
+                                      allure_rerunner: AllureRerunnerPlugin):
+    with given:
+        await fire_arg_parsed_event(dispatcher, reruns=0)
+        scheduler = Mock()
+
+    with when:
+        await fire_startup_event(dispatcher, scheduler)
+
+    with then:
+        assert allure_rerunner._scheduler is scheduler
+
+
 @pytest.mark.parametrize("reruns", [0, 1, 3])
 @pytest.mark.usefixtures(allure_rerunner.__name__)
 async def test_rerun_failed(reruns: int, *,
@@ -71,6 +120,29 @@ async def test_rerun_failed(reruns: int, *,
     with when:
         await dispatcher.fire(scenario_failed_event)
 
+    with then:
+        if reruns > 0:
+            assert scheduler_.mock_calls == [call.schedule_many(scenario_result.scenario, reruns)]
+        else:
+            assert scheduler_.mock_calls == []
+        assert sleep_.mock_calls == []
+
+
+@pytest.mark.parametrize("reruns", [1, 3])
+@pytest.mark.usefixtures(allure_rerunner.__name__)
+async def test_rerun_failed_with_custom_scheduler(reruns: int, *,
+                                                  dispatcher: Dispatcher, sleep_: AsyncMock):
+    with given:
+        await fire_arg_parsed_event(dispatcher, reruns=reruns)
+        scheduler_ = Mock(spec=ScenarioScheduler)
+        await fire_startup_event(dispatcher, scheduler_)
+
+        scenario_result = make_scenario_result().mark_failed()
+        scenario_failed_event = ScenarioFailedEvent(scenario_result)
+
+    with when:
+        await dispatcher.fire(scenario_failed_event)
+
     with then:
         assert scheduler_.mock_calls == [call.schedule(scenario_result.scenario)] * reruns
         assert sleep_.mock_calls == []
@@ -175,6 +247,44 @@ async def test_no_reruns_delay(*, dispatcher: Dispatcher, scheduler_: Mock, slee
         assert sleep_.mock_calls == []
 
 
+@pytest.mark.parametrize(("reruns_delay", "subscribed"), [
+    (0.0, False),
+    (0.1, True),
+])
+@pytest.mark.parametrize("event_cls", [ScenarioRunEvent, ScenarioSkippedEvent])
+async def test_execute_subscribed_only_with_reruns_delay(reruns_delay: float, subscribed: bool,
+                                                         event_cls: Type[Event], *,
+                                                         dispatcher: Dispatcher,
+                                                         allure_rerunner: AllureRerunnerPlugin):
+    with when, patch.object(dispatcher, "listen", wraps=dispatcher.listen) as listen_:
+        await fire_arg_parsed_event(dispatcher, reruns=2, reruns_delay=reruns_delay)
+
+    with then:
+        res = call(event_cls, allure_rerunner.on_scenario_execute) in listen_.mock_calls
+        assert res is subscribed
+
+
+@pytest.mark.parametrize("event_cls", [ScenarioRunEvent, ScenarioSkippedEvent])
+@pytest.mark.usefixtures(allure_rerunner.__name__)
+async def test_no_sleep_without_reruns_delay(event_cls: Type[Event], *,
+                                             dispatcher: Dispatcher, scheduler_: Mock,
+                                             sleep_: AsyncMock):
+    with given:
+        await fire_arg_parsed_event(dispatcher, reruns=2)
+        await fire_startup_event(dispatcher, scheduler_)
+        scenario_failed_event = await fire_failed_event(dispatcher)
+        scheduler_.reset_mock()
+
+        event = event_cls(scenario_failed_event.scenario_result)
+
+    with when:
+        await dispatcher.fire(event)
+
+    with then:
+        assert scheduler_.mock_calls == []
+        assert sleep_.mock_calls == []
+
+
 @pytest.mark.usefixtures(allure_rerunner.__name__)
 async def test_add_summary(dispatcher: Dispatcher, scheduler_: Mock):
     with given:
@@ -7,7 +7,7 @@ from vedro.core import AggregatedResult, MonotonicScenarioScheduler, ScenarioRes
 
 from vedro_allure_reporter.allure_rerunner import AllureRerunnerScenarioScheduler as Scheduler
 
-from ._utils import make_scenario_result, scheduler
+from ._utils import drain_scheduler, make_scenario_result, make_vscenario, scheduler
 
 __all__ = ("scheduler",)  # fixtures
 
@@ -28,6 +28,42 @@ def test_aggregate_nothing(scheduler: Scheduler):
         assert exc.type is AssertionError
 
 
+@pytest.mark.parametrize("times", [0, 1, 3])
+async def test_schedule_many(times: int):
+    with given:
+        scenario = make_vscenario()
+        scheduler = Scheduler([scenario])
+        expected = Scheduler([scenario])
+        for _ in range(times):
+            expected.schedule(scenario)
+
+    with when:
+        scheduler.schedule_many(scenario, times)
+
+    with then:
+        assert list(scheduler.scheduled) == list(expected.scheduled)
+        assert [s async for s in scheduler] == [s async for s in expected]
+
+
+@pytest.mark.parametrize("times", [1, 3])
+async def test_schedule_many_while_running(times: int):
+    with given:
+        scenario = make_vscenario()
+        scheduler = Scheduler([scenario])
+        expected = Scheduler([scenario])
+
+        await scheduler.__aiter__().__anext__()
+        await expected.__aiter__().__anext__()
+        for _ in range(times):
+            expected.schedule(scenario)
+
+    with when:
+        scheduler.schedule_many(scenario, times)
+
+    with then:
+        assert await drain_scheduler(scheduler) == await drain_scheduler(expected)
+
+
 @pytest.mark.parametrize("get_scenario_results", [
     lambda: [make_scenario_result().mark_passed(), make_scenario_result().mark_passed()],
     lambda: [make_scenario_result().mark_failed(), make_scenario_result().mark_failed()],
@@ -44,6 +80,25 @@ def test_aggregate_results(get_scenario_results: Callable[[], List[ScenarioResul
         assert aggregated_result == expected
 
 
+@pytest.mark.parametrize("make_result", [
+    lambda: make_scenario_result().mark_passed(),
+    lambda: make_scenario_result().mark_failed(),
+    lambda: make_scenario_result().mark_skipped(),
+    lambda: make_scenario_result(),
+])
+def test_aggregate_single_result(make_result: Callable[[], ScenarioResult], *,
+                                 scheduler: Scheduler):
+    with given:
+        scenario_result = make_result()
+
+    with when:
+        aggregated_result = scheduler.aggregate_results([scenario_result])
+
+    with then:
+        expected = AggregatedResult.from_existing(scenario_result, [scenario_result])
+        assert aggregated_result == expected
+
+
 def test_aggregate_2passed_1_failed(scheduler: Scheduler):
     with given:
         passed_first = make_scenario_result().mark_passed()
@@ -86,3 +141,31 @@ def test_aggregate_all_failed(scheduler: Scheduler):
     with then:
         expected = AggregatedResult.from_existing(scenario_results[-1], scenario_results)
         assert aggregated_result == expected
+
+
+def test_aggregate_failed_and_skipped(scheduler: Scheduler):
+    with given:
+        failed = make_scenario_result().mark_failed()
+        skipped = make_scenario_result().mark_skipped()
+
+        scenario_results = [failed, skipped]
+
+    with when:
+        aggregated_result = scheduler.aggregate_results(scenario_results)
+
+    with then:
+        expected = AggregatedResult.from_existing(failed, scenario_results)
+        assert aggregated_result == expected
+
+
+def test_aggregate_results_without_instance():
+    with given:
+        scenario_results = [make_scenario_result().mark_failed(),
+                            make_scenario_result().mark_passed()]
+
+    with when:
+        aggregated_result = Scheduler.aggregate_results(scenario_results)
+
+    with then:
+        expected = AggregatedResult.from_existing(scenario_results[-1], scenario_results)
+        assert aggregated_result == expected
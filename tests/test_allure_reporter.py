@@ -1,10 +1,11 @@
 from typing import Any, Callable
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
 import pytest
 from baby_steps import given, then, when
-from vedro.core import AggregatedResult, Dispatcher, ScenarioResult
-from vedro.events import ArgParsedEvent, ScenarioReportedEvent
+from pytest import raises
+from vedro.core import AggregatedResult, Dispatcher, Report, ScenarioResult
+from vedro.events import ArgParsedEvent, CleanupEvent, ScenarioReportedEvent
 from vedro.plugins.director import DirectorPlugin
 
 from vedro_allure_reporter import AllureReporter, AllureReporterPlugin
@@ -59,6 +60,30 @@ async def test_arg_parsed_event(*, dispatcher: Dispatcher,
         ]
 
 
+async def test_cleanup_event(*, dispatcher: Dispatcher,
+                             director: DirectorPlugin,
+                             reporter: AllureReporterPlugin,
+                             plugin_manager_: Mock,
+                             logger_: Mock):
+    with given:
+        await choose_reporter(dispatcher, director, reporter)
+
+        args = make_parsed_args(allure_report_dir="allure_reports")
+        await dispatcher.fire(ArgParsedEvent(args))
+        plugin_manager_.reset_mock()
+
+        event = CleanupEvent(Report())
+
+    with when:
+        await dispatcher.fire(event)
+
+    with then:
+        assert plugin_manager_.mock_calls == [
+            call.unregister(logger_),
+            call.unregister(reporter),
+        ]
+
+
 @pytest.mark.parametrize("make_result", [
     lambda: make_scenario_result().mark_passed(),
     lambda: make_scenario_result().mark_failed(),
@@ -86,6 +111,131 @@ async def test_scenario_reported(make_result: Callable[[], ScenarioResult], *,
         assert logger_.mock_calls == []
 
 
+async def test_scenario_reported_in_background(*, dispatcher: Dispatcher,
+                                               director: DirectorPlugin,
+                                               reporter: AllureReporterPlugin,
+                                               plugin_manager_: Mock):
+    with given:
+        reporter._report_in_background = True
+
+        await choose_reporter(dispatcher, director, reporter)
+        args = make_parsed_args(allure_report_dir="allure_reports")
+        await dispatcher.fire(ArgParsedEvent(args))
+
+        scenario_result = make_scenario_result().mark_passed()
+        aggregated_result = AggregatedResult.from_existing(scenario_result, [scenario_result])
+        await dispatcher.fire(ScenarioReportedEvent(aggregated_result))
+
+        event = CleanupEvent(Report())
+
+    with when:
+        await dispatcher.fire(event)
+
+    with then:
+        assert plugin_manager_.hook.report_result.call_count == 1
+        assert reporter._report_writer is None
+
+
+async def test_scenario_reported_in_background_error(*, dispatcher: Dispatcher,
+                                                     director: DirectorPlugin,
+                                                     reporter: AllureReporterPlugin,
+                                                     plugin_manager_: Mock,
+                                                     logger_: Mock):
+    with given:
+        reporter._report_in_background = True
+        error = OSError("No space left on device")
+        plugin_manager_.hook.report_result.side_effect = error
+
+        await choose_reporter(dispatcher, director, reporter)
+        args = make_parsed_args(allure_report_dir="allure_reports")
+        await dispatcher.fire(ArgParsedEvent(args))
+
+        for _ in range(2):
+            scenario_result = make_scenario_result().mark_passed()
+            aggregated_result = AggregatedResult.from_existing(scenario_result,
+                                                               [scenario_result])
+            await dispatcher.fire(ScenarioReportedEvent(aggregated_result))
+
+        event = CleanupEvent(Report())
+
+    with when, raises(BaseException) as exc_info:
+        await dispatcher.fire(event)
+
+    with then:
+        assert exc_info.value is error
+        assert plugin_manager_.hook.report_result.call_count == 2
+        assert plugin_manager_.unregister.mock_calls == [
+            call(logger_),
+            call(reporter),
+        ]
+        assert reporter._report_writer is None
+
+
+async def test_report_writer_not_started_on_arg_parsed(*, dispatcher: Dispatcher,
+                                                       director: DirectorPlugin,
+                                                       reporter: AllureReporterPlugin):
+    with given:
+        reporter._report_in_background = True
+
+        await choose_reporter(dispatcher, director, reporter)
+        args = make_parsed_args(allure_report_dir="allure_reports")
+        event = ArgParsedEvent(args)
+
+    with when:
+        await dispatcher.fire(event)
+
+    with then:
+        assert reporter._report_writer is None
+        assert reporter._report_queue is None
+
+
+async def test_report_writer_started_on_first_reported_scenario(*, dispatcher: Dispatcher,
+                                                                director: DirectorPlugin,
+                                                                reporter: AllureReporterPlugin):
+    with given:
+        reporter._report_in_background = True
+
+        await choose_reporter(dispatcher, director, reporter)
+        args = make_parsed_args(allure_report_dir="allure_reports")
+        await dispatcher.fire(ArgParsedEvent(args))
+
+        scenario_result = make_scenario_result().mark_passed()
+        aggregated_result = AggregatedResult.from_existing(scenario_result, [scenario_result])
+        event = ScenarioReportedEvent(aggregated_result)
+
+    with when:
+        await dispatcher.fire(event)
+
+    with then:
+        assert reporter._report_writer is not None
+        assert reporter._report_writer.is_alive()
+        assert reporter._report_queue is not None
+
+    await dispatcher.fire(CleanupEvent(Report()))
+
+
+async def test_cleanup_without_reported_scenarios_in_background(*, dispatcher: Dispatcher,
+                                                                director: DirectorPlugin,
+                                                                reporter: AllureReporterPlugin,
+                                                                plugin_manager_: Mock):
+    with given:
+        reporter._report_in_background = True
+        thread_ = Mock()
+
+        await choose_reporter(dispatcher, director, reporter)
+        args = make_parsed_args(allure_report_dir="allure_reports")
+        event = CleanupEvent(Report())
+
+    with when, patch("vedro_allure_reporter._allure_reporter.Thread", thread_):
+        await dispatcher.fire(ArgParsedEvent(args))
+        await dispatcher.fire(event)
+
+    with then:
+        assert thread_.mock_calls == []
+        assert plugin_manager_.hook.report_result.call_count == 0
+        assert reporter._report_writer is None
+
+
 @pytest.mark.parametrize(("report_rescheduled", "calls"), [
     (False, 1),
     (True, 2),
@@ -138,3 +288,18 @@ async def test_scenario_reported_unknown_status(*, dispatcher: Dispatcher,
         assert plugin_manager_.hook.report_result.assert_called() is None
         assert len(plugin_manager_.mock_calls) == 1
         assert logger_.mock_calls == []
+
+
+def test_format_scope(*, reporter: AllureReporterPlugin):
+    with given:
+        unserializable = object()
+        scope = {"user": {"name": "Иван", "id": 1}, "obj": unserializable}
+
+    with when:
+        res = reporter._format_scope(scope)
+
+    with then:
+        assert res == (
+            '    user:\n{\n    "name": "Иван",\n    "id": 1\n}\n\n'
+            f'    obj:\n{unserializable!r}\n\n'
+        )
@@ -3,6 +3,8 @@ import os
 from hashlib import blake2b
 from mimetypes import guess_extension
 from pathlib import Path
+from queue import Queue
+from threading import Thread
 from time import time
 from traceback import format_exception
 from types import TracebackType
@@ -30,7 +32,13 @@ from vedro.core import (
     StepStatus,
     VirtualScenario,
 )
-from vedro.events import ArgParsedEvent, ArgParseEvent, ScenarioReportedEvent, StartupEvent
+from vedro.events import (
+    ArgParsedEvent,
+    ArgParseEvent,
+    CleanupEvent,
+    ScenarioReportedEvent,
+    StartupEvent,
+)
 from vedro.plugins.director import DirectorInitEvent, Reporter
 
 from .allure_rerunner import AllureRerunner, AllureRerunnerPlugin
@@ -68,7 +76,12 @@ class AllureReporterPlugin(Reporter):
         self._config_labels = config.labels
         self._clean_report_dir = config.clean_report_dir
         self._report_rescheduled_scenarios = config.report_rescheduled_scenarios
+        self._report_in_background = config.report_in_background
+        self._report_queue: "Union[Queue[Union[TestResult, None]], None]" = None
+        self._report_writer: Union[Thread, None] = None
+        self._report_error: Union[BaseException, None] = None
         self._allure_labels: Union[str, None] = None
+        self._scope_encoder = json.JSONEncoder(ensure_ascii=False, indent=4)
         self._allure_rerunner = AllureRerunnerPlugin(AllureRerunner)
 
     async def on_startup(self, event: StartupEvent) -> None:
@@ -108,13 +121,14 @@ class AllureReporterPlugin(Reporter):
 
     def on_chosen(self) -> None:
         """
-        Handle the reporter being chosen and set up event listeners for ArgParse
-        and ScenarioReported events.
+        Handle the reporter being chosen and set up event listeners for ArgParse,
+        ScenarioReported and Cleanup events.
         """
         assert isinstance(self._dispatcher, Dispatcher)
         self._dispatcher.listen(ArgParseEvent, self.on_chosen_arg_parse) \
                         .listen(ArgParsedEvent, self.on_chosen_arg_parsed) \
-                        .listen(ScenarioReportedEvent, self.on_scenario_reported)
+                        .listen(ScenarioReportedEvent, self.on_scenario_reported) \
+                        .listen(CleanupEvent, self.on_cleanup)
 
     def on_chosen_arg_parse(self, event: ArgParseEvent) -> None:
         """
@@ -189,6 +203,76 @@ class AllureReporterPlugin(Reporter):
             self._report_result(aggregated_result,
                                 self._get_scenario_result_status(aggregated_result))
 
+    def on_cleanup(self, event: CleanupEvent) -> None:
+        """
+        Flush pending test results and unregister the reporter and its logger.
+
+        If background reporting is enabled, waits for the writer thread to pass all
+        pending results to the logger. The reporter and its logger are then unregistered
+        from the Allure plugin manager: it is process-wide, so a logger left registered
+        would keep receiving results and attachments of subsequent sessions in the same
+        process and write them into its own (stale) report directory.
+
+        :param event: The Cleanup event containing the final report.
+        :raises BaseException: The first error raised by the logger in the background
+                               writer thread, after the logger has been unregistered.
+        """
+        if self._logger is None:
+            return
+
+        self._stop_report_writer()
+
+        self._plugin_manager.unregister(self._logger)
+        self._plugin_manager.unregister(self)
+        self._logger = None
+
+        if self._report_error is not None:
+            error, self._report_error = self._report_error, None
+            raise error
+
+    def _start_report_writer(self) -> None:
+        """
+        Start a background thread that passes test results to the Allure logger.
+
+        Results are handed over through a bounded queue, so scenario execution never
+        waits on report file writes unless the writer falls far behind. The thread is
+        started lazily with the first result, so sessions that report nothing skip it.
+        """
+        self._report_queue = Queue(maxsize=1024)
+        self._report_writer = Thread(target=self._write_reports, args=(self._report_queue,),
+                                     name="allure-report-writer", daemon=True)
+        self._report_writer.start()
+
+    def _stop_report_writer(self) -> None:
+        """
+        Flush all pending test results and wait for the background writer to finish.
+        """
+        if self._report_queue is None or self._report_writer is None:
+            return
+        self._report_queue.put(None)
+        self._report_writer.join()
+        self._report_queue = None
+        self._report_writer = None
+
+    def _write_reports(self, queue: "Queue[Union[TestResult, None]]") -> None:
+        """
+        Consume test results from the queue until the stop sentinel is received.
+
+        The first error raised by the logger is kept and re-raised on cleanup; the
+        remaining results are still drained so that producers are never blocked.
+
+        :param queue: The queue of test results, terminated by None.
+        """
+        while True:
+            test_result = queue.get()
+            if test_result is None:
+                break
+            try:
+                self._plugin_manager.hook.report_result(result=test_result)
+            except BaseException as e:
+                if self._report_error is None:
+                    self._report_error = e
+
     def _get_scenario_result_status(self, scenario_result: ScenarioResult) -> Status:
         """
         Retrieve the Allure status of a scenario result based on its status.
@@ -341,7 +425,7 @@ class AllureReporterPlugin(Reporter):
         res = ""
         for key, val in scope.items():
             try:
-                val_repr = json.dumps(val, ensure_ascii=False, indent=4)
+                val_repr = self._scope_encoder.encode(val)
             except:  # noqa: E722
                 val_repr = repr(val)
             res += f"{indent * ' '}{key}:\n{val_repr}\n\n"
@@ -393,7 +477,13 @@ class AllureReporterPlugin(Reporter):
                 self._add_attachments(test_step_result, step_result.artifacts)
             test_result.steps.append(test_step_result)
 
-        self._plugin_manager.hook.report_result(result=test_result)
+        if self._report_in_background:
+            if self._report_queue is None:
+                self._start_report_writer()
+            assert self._report_queue is not None  # for type checking
+            self._report_queue.put(test_result)
+        else:
+            self._plugin_manager.hook.report_result(result=test_result)
 
     def _create_status_details(self, exc_info: ExcInfo) -> StatusDetails:
         """
@@ -512,3 +602,8 @@ class AllureReporter(PluginConfig):
     # represented, providing visibility into the scenario's intermediate attempts.
     # If False, only the aggregated final result is reported.
     report_rescheduled_scenarios: bool = False
+
+    # If True, test results are passed to the Allure logger from a background thread,
+    # so writing report files doesn't block the execution of the next scenario.
+    # Pending results are flushed on cleanup.
+    report_in_background: bool = False
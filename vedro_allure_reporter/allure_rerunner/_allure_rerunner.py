@@ -1,7 +1,14 @@
 import asyncio
-from typing import Any, Callable, Coroutine, Type, Union
-
-from vedro.core import ConfigType, Dispatcher, Plugin, PluginConfig, ScenarioScheduler
+from typing import Any, Callable, Coroutine, Type, Union, cast
+
+from vedro.core import (
+    ConfigType,
+    Dispatcher,
+    Plugin,
+    PluginConfig,
+    ScenarioScheduler,
+    VirtualScenario,
+)
 from vedro.events import (
     ArgParsedEvent,
     ArgParseEvent,
@@ -31,6 +38,10 @@ class AllureRerunnerPlugin(Plugin):
     before each rerun if desired.
     """
 
+    __slots__ = ("_sleep", "_dispatcher", "_enabled", "_reruns", "_reruns_delay",
+                 "_global_config", "_scheduler", "_rerun_scenario", "_rerun_scenario_id",
+                 "_reran", "_times", "_delay_suffix",)
+
     def __init__(self, config: Type["AllureRerunner"], *,
                  sleep: SleepType = asyncio.sleep) -> None:
         """
@@ -41,29 +52,34 @@ class AllureRerunnerPlugin(Plugin):
         """
         super().__init__(config)
         self._sleep = sleep
+        self._dispatcher: Union[Dispatcher, None] = None
+        self._enabled: bool = False
         self._reruns: int = 0
         self._reruns_delay: float = 0.0
         self._global_config: Union[ConfigType, None] = None
         self._scheduler: Union[ScenarioScheduler, None] = None
+        self._rerun_scenario: Union[VirtualScenario, None] = None
         self._rerun_scenario_id: Union[str, None] = None
         self._reran: int = 0
         self._times: int = 0
+        self._delay_suffix: str = ""
 
     def subscribe(self, dispatcher: Dispatcher) -> None:
         """
-        Subscribe to events for handling configuration, scenario execution,
-        scenario end results, and cleanup.
+        Subscribe to events for handling configuration, startup, and cleanup.
+
+        Scenario execution and scenario end events are subscribed to only after
+        arguments are parsed, and only if rerunning is enabled. Since the dispatcher
+        orders handlers of equal priority by registration time, these handlers run after
+        the handlers of the same events that other plugins registered in `subscribe`.
 
         :param dispatcher: The event dispatcher.
         """
+        self._dispatcher = dispatcher
         dispatcher.listen(ConfigLoadedEvent, self.on_config_loaded) \
                   .listen(ArgParseEvent, self.on_arg_parse) \
                   .listen(ArgParsedEvent, self.on_arg_parsed) \
                   .listen(StartupEvent, self.on_startup) \
-                  .listen(ScenarioRunEvent, self.on_scenario_execute) \
-                  .listen(ScenarioSkippedEvent, self.on_scenario_execute) \
-                  .listen(ScenarioPassedEvent, self.on_scenario_end) \
-                  .listen(ScenarioFailedEvent, self.on_scenario_end) \
                   .listen(CleanupEvent, self.on_cleanup)
 
     def on_config_loaded(self, event: ConfigLoadedEvent) -> None:
@@ -99,7 +115,7 @@ class AllureRerunnerPlugin(Plugin):
         Handle the event triggered after arguments are parsed.
 
         Validates the provided values for reruns and delay, and if rerunning is enabled,
-        registers the AllureRerunnerScenarioScheduler.
+        registers the AllureRerunnerScenarioScheduler and subscribes to scenario events.
 
         :param event: The ArgParsedEvent with parsed arguments.
         :raises ValueError: If invalid rerun configurations are provided.
@@ -116,12 +132,28 @@ class AllureRerunnerPlugin(Plugin):
         if (self._reruns_delay > 0.0) and (self._reruns < 1):
             raise ValueError("--allure-reruns-delay must be used with --allure-reruns > 0")
 
-        if self._is_rerunning_enabled():
-            assert self._global_config is not None  # for type checking
-            self._global_config.Registry.ScenarioScheduler.register(
-                AllureRerunnerScenarioScheduler,
-                self
-            )
+        self._enabled = self._reruns > 0
+        if not self._enabled:
+            return
+
+        if self._reruns_delay > 0.0:
+            self._delay_suffix = f", with delay {self._reruns_delay!r}s"
+
+        assert self._global_config is not None  # for type checking
+        self._global_config.Registry.ScenarioScheduler.register(
+            AllureRerunnerScenarioScheduler,
+            self
+        )
+
+        assert self._dispatcher is not None  # for type checking
+        self._dispatcher.listen(ScenarioPassedEvent, self.on_scenario_end) \
+                        .listen(ScenarioFailedEvent, self.on_scenario_end)
+
+        # Waiting before a rerun is the only thing done on scenario execution,
+        # so there is no need to schedule a coroutine per scenario without a delay
+        if self._reruns_delay > 0.0:
+            self._dispatcher.listen(ScenarioRunEvent, self.on_scenario_execute) \
+                            .listen(ScenarioSkippedEvent, self.on_scenario_execute)
 
     def on_startup(self, event: StartupEvent) -> None:
         """
@@ -131,6 +163,8 @@ class AllureRerunnerPlugin(Plugin):
 
         :param event: The StartupEvent containing the current scheduler.
         """
+        if self._enabled:
+            assert isinstance(event.scheduler, ScenarioScheduler)
         self._scheduler = event.scheduler
 
     async def on_scenario_execute(self,
@@ -138,16 +172,13 @@ class AllureRerunnerPlugin(Plugin):
         """
         Handle the scenario execution event (both run and skipped).
 
-        If the scenario is being rerun and a delay is configured, waits for the specified
-        delay time before executing the scenario again.
+        Subscribed only when a rerun delay is configured. If the scenario is being rerun,
+        waits for the specified delay time before executing the scenario again.
 
         :param event: Either ScenarioRunEvent or ScenarioSkippedEvent.
         """
-        if not self._is_rerunning_enabled():
-            return
-
         scenario = event.scenario_result.scenario
-        if (self._rerun_scenario_id == scenario.unique_id) and (self._reruns_delay > 0.0):
+        if (scenario is self._rerun_scenario) or (scenario.unique_id == self._rerun_scenario_id):
             await self._sleep(self._reruns_delay)
 
     async def on_scenario_end(self,
@@ -160,19 +191,31 @@ class AllureRerunnerPlugin(Plugin):
 
         :param event: Either ScenarioPassedEvent or ScenarioFailedEvent.
         """
-        if not self._is_rerunning_enabled():
+        scenario_result = event.scenario_result
+        scenario = scenario_result.scenario
+        # Reruns are scheduled with the same VirtualScenario object, so identity is checked
+        # first to avoid rebuilding unique_id (a computed property) on every rerun
+        if scenario is self._rerun_scenario:
             return
-        assert isinstance(self._scheduler, ScenarioScheduler)  # for type checking
-
-        scenario = event.scenario_result.scenario
-        if scenario.unique_id != self._rerun_scenario_id:
-            self._rerun_scenario_id = scenario.unique_id
-
-            if event.scenario_result.is_failed():
-                self._reran += 1
-                for _ in range(self._reruns):
-                    self._scheduler.schedule(scenario)
-                    self._times += 1
+        unique_id = scenario.unique_id
+        if unique_id == self._rerun_scenario_id:
+            return
+        self._rerun_scenario = scenario
+        self._rerun_scenario_id = unique_id
+
+        if scenario_result.is_failed():
+            # Checked once in on_startup
+            scheduler = cast(ScenarioScheduler, self._scheduler)
+            reruns = self._reruns
+            self._reran += 1
+            if isinstance(scheduler, AllureRerunnerScenarioScheduler):
+                scheduler.schedule_many(scenario, reruns)
+            else:
+                # The scheduler may have been replaced by another plugin
+                schedule = scheduler.schedule
+                for _ in range(reruns):
+                    schedule(scenario)
+            self._times += reruns
 
     def on_cleanup(self, event: CleanupEvent) -> None:
         """
@@ -183,32 +226,12 @@ class AllureRerunnerPlugin(Plugin):
 
         :param event: The CleanupEvent containing the report.
         """
-        if not self._is_rerunning_enabled():
+        if not self._enabled:
             return
-        message = self._get_summary_message()
-        event.report.add_summary(message)
-
-    def _is_rerunning_enabled(self) -> bool:
-        """
-        Check if rerunning is enabled.
-
-        :return: True if reruns are greater than zero, False otherwise.
-        """
-        return self._reruns > 0
-
-    def _get_summary_message(self) -> str:
-        """
-        Construct a summary message for the final report.
-
-        :return: A string summarizing how many scenarios were rerun and how many times,
-                 including any configured delay.
-        """
         ss = "" if self._reran == 1 else "s"
         ts = "" if self._times == 1 else "s"
-        message = f"rerun {self._reran} scenario{ss}, {self._times} time{ts}"
-        if self._reruns_delay:
-            message += f", with delay {self._reruns_delay!r}s"
-        return message
+        message = f"rerun {self._reran} scenario{ss}, {self._times} time{ts}{self._delay_suffix}"
+        event.report.add_summary(message)
 
 
 class AllureRerunner(PluginConfig):
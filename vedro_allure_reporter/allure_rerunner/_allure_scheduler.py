@@ -1,6 +1,11 @@
 from typing import List
 
-from vedro.core import AggregatedResult, MonotonicScenarioScheduler, ScenarioResult
+from vedro.core import (
+    AggregatedResult,
+    MonotonicScenarioScheduler,
+    ScenarioResult,
+    VirtualScenario,
+)
 
 __all__ = ("AllureRerunnerScenarioScheduler",)
 
@@ -15,7 +20,34 @@ class AllureRerunnerScenarioScheduler(MonotonicScenarioScheduler):
       - Failed, if every rerun of the scenario failed.
     """
 
-    def aggregate_results(self, scenario_results: List[ScenarioResult]) -> AggregatedResult:
+    def schedule_many(self, scenario: VirtualScenario, times: int) -> None:
+        """
+        Schedule a scenario for repeated execution several times at once.
+
+        This is equivalent to calling `schedule` the given number of times, but updates
+        the repeat counters of the scheduled list and the queue in a single step.
+
+        :param scenario: The virtual scenario to be scheduled.
+        :param times: The number of additional executions to schedule.
+        """
+        if times < 1:
+            return
+
+        unique_id = scenario.unique_id
+        if unique_id in self._scheduled:
+            scn, repeats = self._scheduled[unique_id]
+            self._scheduled[unique_id] = (scn, repeats + times)
+        else:
+            self._scheduled[unique_id] = (scenario, times - 1)
+
+        if unique_id in self._queue:
+            scn, repeats = self._queue[unique_id]
+            self._queue[unique_id] = (scn, repeats + times)
+        else:
+            self._queue[unique_id] = (scenario, times - 1)
+
+    @staticmethod
+    def aggregate_results(scenario_results: List[ScenarioResult]) -> AggregatedResult:
         """
         Aggregate scenario results into a single outcome following Allure logic.
 
@@ -30,19 +62,22 @@ class AllureRerunnerScenarioScheduler(MonotonicScenarioScheduler):
         """
         assert len(scenario_results) > 0
 
-        passed, failed = [], []
-        for scenario_result in scenario_results:
-            if scenario_result.is_passed():
-                passed.append(scenario_result)
-            elif scenario_result.is_failed():
-                failed.append(scenario_result)
+        # A scenario that was not rerun is its own final result
+        if len(scenario_results) == 1:
+            return AggregatedResult.from_existing(scenario_results[0], scenario_results)
 
-        # Determine the final result:
+        # Determine the final result, scanning from the latest run backwards:
+        # If at least one passed scenario, final is the last passed one.
+        # Otherwise, final is the last failed one.
         # If no passed and no failed, fallback to last scenario_result (edge case)
-        # If at least one passed scenario, final is passed; otherwise, failed.
-        if len(passed) == 0 and len(failed) == 0:
-            result = scenario_results[-1]
+        for result in reversed(scenario_results):
+            if result.is_passed():
+                break
         else:
-            result = passed[-1] if len(passed) > 0 else failed[-1]
+            for result in reversed(scenario_results):
+                if result.is_failed():
+                    break
+            else:
+                result = scenario_results[-1]
 
         return AggregatedResult.from_existing(result, scenario_results)